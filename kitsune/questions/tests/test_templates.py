@@ -1,4 +1,3 @@
-import json
 import random
 from datetime import timedelta
 from string import ascii_letters
@@ -1194,7 +1193,7 @@ class TaggingViewTestsAsAdmin(TestCase):
             data={"tag-name": "RED"},
             HTTP_X_REQUESTED_WITH="XMLHttpRequest",
         )
-        self.assertEqual(json.loads(response.content)["canonicalName"], "red")
+        self.assertEqual(response.json()["canonicalName"], "red")
 
 
 def _add_tag_url(question_id):
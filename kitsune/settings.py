@@ -502,6 +502,9 @@ TEMPLATES = [
             # Don't figure out which template loader to use based on
             # file extension
             "match_extension": "",
+            # Compiled templates are cached by name; only check their source
+            # files for changes during local development, never under test.
+            "auto_reload": DEBUG and not TEST,
             "newstyle_gettext": True,
             "context_processors": _CONTEXT_PROCESSORS,
             "undefined": "jinja2.Undefined",
@@ -516,6 +519,14 @@ TEMPLATES = [
             "policies": {
                 "ext.i18n.trimmed": True,
             },
+            # Under test, keep compiled template bytecode in a temp directory
+            # (jinja2 picks a private one when given None), so each parallel
+            # test worker and each later run skips recompiling every template.
+            "bytecode_cache": {
+                "enabled": TEST,
+                "backend": "jinja2.FileSystemBytecodeCache",
+                "name": None,
+            },
         },
     },
     {
@@ -616,6 +627,11 @@ AUTHENTICATION_BACKENDS: tuple[str, ...] = (
     "django.contrib.auth.backends.ModelBackend",
     "guardian.backends.ObjectPermissionBackend",
 )
+if TEST:
+    # Test users all share a throwaway password, so there's no point paying
+    # for a slow, secure hash every time one is created or logs in.
+    PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
+
 if READ_ONLY:
     AUTHENTICATION_BACKENDS = ("kitsune.sumo.readonlyauth.ReadOnlyBackend",)
     OIDC_ENABLE = False
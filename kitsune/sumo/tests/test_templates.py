@@ -1,9 +1,11 @@
+from functools import cache
+
 from django.template import engines as template_engines
-from django.template.loader import render_to_string
+from django.template.loader import get_template
 from django.test import override_settings
 from django.test.client import RequestFactory
 from django.utils import translation
-from pyquery import PyQuery as pq
+from lxml import html as lxml_html
 
 from kitsune.announcements.tests import AnnouncementFactory
 from kitsune.sumo.tests import TestCase
@@ -19,6 +21,13 @@ from kitsune.users.tests import UserFactory
 #     self.assertEqual('/', href.attrib['href'][0])
 
 
+@cache
+def _errorlist_macro():
+    """Load the errorlist macro once and call it directly."""
+    env = template_engines["jinja2"].env
+    return env.get_template("layout/errorlist.html").module.errorlist
+
+
 class MockRequestTests(TestCase):
     """Base class for tests that need a mock request"""
 
@@ -34,45 +43,52 @@ class MockRequestTests(TestCase):
 class BaseTemplateTests(MockRequestTests):
     """Tests for base.html"""
 
-    def setUp(self):
-        super().setUp()
-        self.template = "base.html"
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.template = get_template("base.html")
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = UserFactory()
 
     def test_dir_ltr(self):
         """Make sure dir attr is set to 'ltr' for LTR language."""
-        self.request.user = UserFactory()
-        html = render_to_string(self.template, request=self.request)
-        self.assertEqual("ltr", pq(html)("html").attr["dir"])
+        self.request.user = self.user
+        html = self.template.render(request=self.request)
+        self.assertEqual("ltr", lxml_html.document_fromstring(html).get("dir"))
 
     def test_dir_rtl(self):
         """Make sure dir attr is set to 'rtl' for RTL language."""
         translation.activate("he")
         self.request.LANGUAGE_CODE = "he"
-        self.request.user = UserFactory()
-        html = render_to_string(self.template, request=self.request)
-        self.assertEqual("rtl", pq(html)("html").attr["dir"])
+        self.request.user = self.user
+        html = self.template.render(request=self.request)
+        self.assertEqual("rtl", lxml_html.document_fromstring(html).get("dir"))
         translation.deactivate()
 
     def test_multi_feeds(self):
         """Ensure that multiple feeds are put into the page when set."""
 
-        self.request.user = UserFactory()
+        self.request.user = self.user
         feed_urls = (
             ("/feed_one", "First Feed"),
             ("/feed_two", "Second Feed"),
         )
 
-        doc = pq(render_to_string(self.template, {"feeds": feed_urls}, request=self.request))
-        feeds = doc('link[type="application/atom+xml"]')
+        doc = lxml_html.document_fromstring(
+            self.template.render({"feeds": feed_urls}, request=self.request)
+        )
+        feeds = doc.cssselect('link[type="application/atom+xml"]')
         self.assertEqual(2, len(feeds))
         self.assertEqual("First Feed", feeds[0].attrib["title"])
         self.assertEqual("Second Feed", feeds[1].attrib["title"])
 
     def test_readonly_attr(self):
-        self.request.user = UserFactory()
-        html = render_to_string(self.template, request=self.request)
-        doc = pq(html)
-        self.assertEqual("false", doc("body")[0].attrib["data-readonly"])
+        self.request.user = self.user
+        html = self.template.render(request=self.request)
+        doc = lxml_html.document_fromstring(html)
+        self.assertEqual("false", doc.body.get("data-readonly"))
 
     def test_announcement_bar_no_empty_paragraphs(self):
         """
@@ -80,28 +96,30 @@ class BaseTemplateTests(MockRequestTests):
         re-wrapped in a <p>, and check that trailing blank lines in the source
         are stripped.
         """
-        self.request.user = UserFactory()
+        self.request.user = self.user
         # Two real paragraphs plus a trailing blank line, exercising both the
         # double-wrap and the trailing-empty-paragraph failure modes.
         announcement = AnnouncementFactory(content="First line.\n\nSecond line.\n\n")
-        html = render_to_string(self.template, request=self.request)
-        paragraphs = pq(html)("#announce-{} p".format(announcement.id))
+        html = self.template.render(request=self.request)
+        paragraphs = lxml_html.document_fromstring(html).cssselect(
+            "#announce-{} p".format(announcement.id)
+        )
         # Exactly the two authored paragraphs (no extra empty ones).
         self.assertEqual(2, len(paragraphs))
 
     @override_settings(READ_ONLY=True)
     def test_readonly_login_link_disabled(self):
         """Ensure that login/register links are hidden in READ_ONLY."""
-        self.request.user = UserFactory()
-        html = render_to_string(self.template, request=self.request)
-        doc = pq(html)
-        self.assertEqual(0, len(doc("a.sign-out, a.sign-in")))
+        self.request.user = self.user
+        html = self.template.render(request=self.request)
+        doc = lxml_html.document_fromstring(html)
+        self.assertEqual(0, len(doc.cssselect("a.sign-out, a.sign-in")))
 
     # TODO: Enable this test after the redesign is complete.
     # @override_settings(READ_ONLY=False)
     # def test_not_readonly_login_link_enabled(self):
     #   """Ensure that login/register links are visible in not READ_ONLY."""
-    #    html = render_to_string(self.template, request=self.request)
+    #    html = self.template.render(request=self.request)
     #    doc = pq(html)
     #    assert len(doc('a.sign-out, a.register')) > 0
 
@@ -122,11 +140,7 @@ class ErrorListTests(MockRequestTests):
             def non_field_errors(self):
                 return ['<"evil&ness-non-field">']
 
-        source = (
-            """{% from "layout/errorlist.html" import errorlist %}""" """{{ errorlist(form) }}"""
-        )
-        template = template_engines["jinja2"].from_string(source)
-        html = template.render({"form": MockForm()})
+        html = str(_errorlist_macro()(MockForm()))
         assert '<"evil&ness' not in html
         assert "&lt;&#34;evil&amp;ness-field&#34;&gt;" in html
         assert "&lt;&#34;evil&amp;ness-non-field&#34;&gt;" in html
@@ -364,6 +364,11 @@ def in_staff_group(user: User | None) -> bool:
     return bool(user and user.is_authenticated and user.profile.in_staff_group)
 
 
+def is_superuser_or_staff(user: User | None) -> bool:
+    """Check if a user is a superuser or in the Staff group."""
+    return bool(user and (user.is_superuser or in_staff_group(user)))
+
+
 def has_support_config(product=None):
     """Check if a product has an active support configuration (forum or Zendesk).
 
@@ -1,7 +1,6 @@
 import factory
 
 from kitsune.questions.tests import QuestionFactory
-from kitsune.sumo.tests import TestCase
 from kitsune.upload.models import ImageAttachment
 from kitsune.upload.storage import RenameFileStorage
 from kitsune.users.tests import UserFactory
@@ -17,13 +16,12 @@ class ImageAttachmentFactory(factory.django.DjangoModelFactory):
 
 
 def check_file_info(file_info, name, width, height, delete_url, url, thumbnail_url):
-    tc = TestCase()
-    tc.assertEqual(name, file_info["name"])
-    tc.assertEqual(width, file_info["width"])
-    tc.assertEqual(height, file_info["height"])
-    tc.assertEqual(delete_url, file_info["delete_url"])
-    tc.assertEqual(url, file_info["url"])
-    tc.assertEqual(thumbnail_url, file_info["thumbnail_url"])
+    assert name == file_info["name"]
+    assert width == file_info["width"]
+    assert height == file_info["height"]
+    assert delete_url == file_info["delete_url"]
+    assert url == file_info["url"]
+    assert thumbnail_url == file_info["thumbnail_url"]
 
 
 def get_file_name(name):
@@ -1,3 +1,4 @@
+from io import BytesIO
 from unittest import mock
 
 from django.conf import settings
@@ -17,18 +18,26 @@ from kitsune.upload.utils import (
 )
 from kitsune.users.tests import UserFactory
 
+TEST_JPG = "kitsune/upload/tests/media/test.jpg"
+ANIMATED_GIF = "kitsune/upload/tests/media/animated.gif"
+
+
+def _read(path):
+    with open(path, "rb") as f:
+        return f.read()
+
 
 class OpenAsPILImageTestCase(TestCase):
     def test_valid_image(self):
         """open_as_pil_image returns a PIL image for a valid file."""
-        with open("kitsune/upload/tests/media/test.jpg", "rb") as f:
+        with open(TEST_JPG, "rb") as f:
             image = open_as_pil_image(f)
             image.close()
 
     @override_settings(IMAGE_MAX_PIXELS=1)
     def test_image_too_large(self):
         """open_as_pil_image raises FileTooLargeError when dimensions exceed IMAGE_MAX_PIXELS."""
-        with open("kitsune/upload/tests/media/test.jpg", "rb") as f:
+        with open(TEST_JPG, "rb") as f:
             with self.assertRaises(FileTooLargeError):
                 open_as_pil_image(f)
 
@@ -42,21 +51,30 @@ class OpenAsPILImageTestCase(TestCase):
 class CheckFileSizeTestCase(TestCase):
     """Tests for check_file_size"""
 
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.jpg_data = _read(TEST_JPG)
+
     def test_check_file_size_under(self):
         """No exception should be raised"""
-        with open("kitsune/upload/tests/media/test.jpg", "rb") as f:
-            up_file = File(f)
-            check_file_size(up_file, settings.IMAGE_MAX_FILESIZE)
+        up_file = File(BytesIO(self.jpg_data), name=TEST_JPG)
+        check_file_size(up_file, settings.IMAGE_MAX_FILESIZE)
 
     def test_check_file_size_over(self):
         """FileTooLargeError should be raised"""
+        up_file = File(BytesIO(self.jpg_data), name=TEST_JPG)
         with self.assertRaises(FileTooLargeError):
-            with open("kitsune/upload/tests/media/test.jpg", "rb") as f:
-                up_file = File(f)
-                check_file_size(up_file, 0)
+            check_file_size(up_file, 0)
 
 
 class CreateImageAttachmentTestCase(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.jpg_data = _read(TEST_JPG)
+        cls.gif_data = _read(ANIMATED_GIF)
+
     def setUp(self):
         super().setUp()
         self.user = UserFactory()
@@ -72,9 +90,8 @@ class CreateImageAttachmentTestCase(TestCase):
 
         Verifies all appropriate fields are correctly set.
         """
-        with open("kitsune/upload/tests/media/test.jpg", "rb") as f:
-            up_file = File(f)
-            file_info = create_imageattachment({"image": up_file}, self.user, self.obj)
+        up_file = File(BytesIO(self.jpg_data), name=TEST_JPG)
+        file_info = create_imageattachment({"image": up_file}, self.user, self.obj)
 
         image = ImageAttachment.objects.all()[0]
         check_file_info(
@@ -93,15 +110,13 @@ class CreateImageAttachmentTestCase(TestCase):
 
         Verifies all appropriate fields are correctly set.
         """
-        filepath = "kitsune/upload/tests/media/animated.gif"
-        with open(filepath, "rb") as f:
-            up_file = File(f)
-            file_info = create_imageattachment({"image": up_file}, self.user, self.obj)
+        up_file = File(BytesIO(self.gif_data), name=ANIMATED_GIF)
+        file_info = create_imageattachment({"image": up_file}, self.user, self.obj)
 
         image = ImageAttachment.objects.all()[0]
         check_file_info(
             file_info,
-            name=filepath,
+            name=ANIMATED_GIF,
             width=120,
             height=120,
             delete_url=image.get_delete_url(),
@@ -27,7 +27,7 @@ from kitsune.sumo.apps import ProgrammingError
 from kitsune.sumo.i18n import split_into_language_and_path
 from kitsune.sumo.models import LocaleField, ModelBase
 from kitsune.sumo.urlresolvers import reverse
-from kitsune.sumo.utils import PrettyJSONEncoder, in_staff_group
+from kitsune.sumo.utils import PrettyJSONEncoder, is_superuser_or_staff
 from kitsune.tags.models import BigVocabTaggableManager
 from kitsune.tidings.models import NotificationsMixin
 from kitsune.wiki.config import (
@@ -731,8 +731,7 @@ class Document(NotificationsMixin, ModelBase, DocumentPermissionMixin):
         """
         return self.is_unrestricted_for(user, use_cache=use_cache) and bool(
             self.current_revision
-            or user.is_superuser
-            or in_staff_group(user)
+            or is_superuser_or_staff(user)
             or (
                 user.is_authenticated
                 and (
@@ -773,7 +772,7 @@ class Document(NotificationsMixin, ModelBase, DocumentPermissionMixin):
             # Translations follow their parent's restrictions.
             return self.parent.is_unrestricted_for(user, use_cache=use_cache)
 
-        if user.is_superuser or in_staff_group(user):
+        if is_superuser_or_staff(user):
             return True
 
         is_restricted = self.is_restricted if use_cache else self.get_is_restricted()
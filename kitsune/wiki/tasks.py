@@ -1,6 +1,7 @@
 import logging
+from collections import defaultdict
 from datetime import date, datetime, timedelta
-from itertools import batched, chain
+from itertools import batched
 
 import waffle
 from celery import shared_task
@@ -11,7 +12,7 @@ from django.core.cache import cache
 from django.core.exceptions import ValidationError
 from django.core.mail import mail_admins
 from django.db import transaction
-from django.db.models import F, ObjectDoesNotExist, Q, Subquery
+from django.db.models import Case, Exists, F, OuterRef, Prefetch, Q, Subquery, When
 from django.db.models.functions import Coalesce
 from django.urls import reverse as django_reverse
 from django.utils import timezone
@@ -26,6 +27,7 @@ from kitsune.products.models import Product
 from kitsune.sumo import email_utils
 from kitsune.sumo.decorators import skip_if_read_only_mode
 from kitsune.sumo.urlresolvers import reverse
+from kitsune.sumo.utils import is_superuser_or_staff
 from kitsune.wiki.badges import WIKI_BADGES
 from kitsune.wiki.config import (
     HOW_TO_CATEGORY,
@@ -47,6 +49,9 @@ from kitsune.wiki.utils import generate_short_url
 
 log = logging.getLogger("k.task")
 
+# How many weekly "Ready for review" digests to send per mail connection.
+REVIEW_DIGEST_BATCH_SIZE = 100
+
 shared_task_with_retry = shared_task(
     acks_late=True, autoretry_for=(Exception,), retry_backoff=2, retry_kwargs={"max_retries": 3}
 )
@@ -522,68 +527,116 @@ def send_weekly_ready_for_review_digest() -> None:
             to_email=user.email,
         )
 
+    def _get_docs_list(docs):
+        # Each document is filed under its own products, or its parent's
+        # products if it's a translation, so bucket them all in one query.
+        docs_by_product = defaultdict(list)
+        for doc in (
+            docs.annotate(
+                product_id=Case(
+                    When(parent=None, then=F("products")), default=F("parent__products")
+                )
+            )
+            .values("id", "slug", "title", "product_id")
+            .distinct()
+        ):
+            docs_by_product[doc["product_id"]].append(doc)
+
+        docs_list = [
+            {
+                "product": pgettext("DB: products.Product.title", product.title),
+                "docs": docs_by_product[product.id],
+            }
+            for product in products
+            if product.id in docs_by_product
+        ]
+
+        if None in docs_by_product:
+            docs_list.append({"product": _("Other products"), "docs": docs_by_product[None]})
+
+        return docs_list
+
     # Get the list of revisions ready for review
     categories = (HOW_TO_CATEGORY, TROUBLESHOOTING_CATEGORY, TEMPLATES_CATEGORY)
 
     revs = Revision.objects.filter(
-        reviewed=None, document__is_archived=False, document__category__in=categories
+        Q(document__current_revision_id__lt=F("id")) | Q(document__current_revision_id=None),
+        reviewed=None,
+        document__is_archived=False,
+        document__category__in=categories,
     )
 
-    revs = revs.filter(
-        Q(document__current_revision_id__lt=F("id")) | Q(document__current_revision_id=None)
+    doc_ids_by_locale = defaultdict(set)
+    for loc, doc_id in revs.values_list("document__locale", "document_id").distinct():
+        doc_ids_by_locale[loc].add(doc_id)
+
+    products = list(Product.active.all())
+    host = Site.objects.get_current().domain
+
+    # Work out Staff membership with the users themselves, rather than with one
+    # query per reviewer when they're checked below.
+    active_users = (
+        User.objects.filter(is_active=True)
+        .select_related("profile")
+        .annotate(
+            is_in_staff_group=Exists(
+                User.groups.through.objects.filter(
+                    user=OuterRef("pk"), group__name=settings.STAFF_GROUP
+                )
+            )
+        )
     )
+    locale_teams = {
+        team.locale: team
+        for team in Locale.objects.filter(locale__in=doc_ids_by_locale).prefetch_related(
+            Prefetch("leaders", queryset=active_users),
+            Prefetch("reviewers", queryset=active_users),
+        )
+    }
 
-    locales = revs.values_list("document__locale", flat=True).distinct()
-    products = Product.active.all()
+    def _make_digest_mails():
+        for loc, doc_ids in doc_ids_by_locale.items():
+            if (team := locale_teams.get(loc)) is None:
+                # Locale does not exist, so skip to the next locale
+                continue
 
-    messages = []
+            users = set(team.leaders.all()) | set(team.reviewers.all())
 
-    for loc in locales:
-        doc_ids = revs.filter(document__locale=loc).values_list("document", flat=True).distinct()
+            # Staff and superusers are never restricted, so they all share a list.
+            unrestricted_docs_list = None
 
-        try:
-            leaders = Locale.objects.get(locale=loc).leaders.all()
-            reviewers = Locale.objects.get(locale=loc).reviewers.all()
-            users = {user for user in chain(leaders, reviewers) if user.is_active}
-        except ObjectDoesNotExist:
-            # Locale does not exist, so skip to the next locale
-            continue
-
-        for user in users:
-            docs_list = []
-            docs = Document.objects.unrestricted(user, id__in=doc_ids)
-            for product in products:
-                product_docs = docs.filter(
-                    Q(parent=None, products__in=[product]) | Q(parent__products__in=[product])
-                )
-                if product_docs:
-                    docs_list.append(
-                        {
-                            "product": pgettext("DB: products.Product.title", product.title),
-                            "docs": product_docs,
-                        }
-                    )
+            for user in users:
+                # Seed the profile's cached Staff check from the annotation.
+                user.profile.in_staff_group = user.is_in_staff_group
 
-            product_docs = docs.filter(Q(parent=None, products=None) | Q(parent__products=None))
+                if is_superuser_or_staff(user):
+                    if unrestricted_docs_list is None:
+                        unrestricted_docs_list = _get_docs_list(
+                            Document.objects.filter(id__in=doc_ids)
+                        )
+                    docs_list = unrestricted_docs_list
+                else:
+                    docs_list = _get_docs_list(Document.objects.unrestricted(user, id__in=doc_ids))
 
-            if product_docs:
-                docs_list.append({"product": _("Other products"), "docs": product_docs})
+                if not docs_list:
+                    # Nothing this user is allowed to see needs reviewing.
+                    continue
 
-            messages.append(
-                _make_digest_mail(
+                yield _make_digest_mail(
                     loc,
                     user,
                     {
-                        "host": Site.objects.get_current().domain,
+                        "host": host,
                         "locale": loc,
                         "recipient": user,
                         "docs_list": docs_list,
                         "products": products,
                     },
                 )
-            )
 
-    email_utils.send_messages(messages)
+    # Send in batches so we never hold every rendered digest at once.
+    for messages in batched(_make_digest_mails(), REVIEW_DIGEST_BATCH_SIZE, strict=False):
+        email_utils.send_messages(messages)
 
 
 @shared_task
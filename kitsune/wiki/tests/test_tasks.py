@@ -7,14 +7,18 @@ from django.conf import settings
 from django.contrib.sites.models import Site
 from django.core import mail
 from django.core.cache import cache
+from django.db import connection
 from django.test import override_settings
 from django.test.client import RequestFactory
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 
 from kitsune.kbadge.utils import get_or_create_badge
+from kitsune.products.tests import ProductFactory
+from kitsune.sumo import email_utils
 from kitsune.sumo.sanitize import clean
 from kitsune.sumo.tests import TestCase
-from kitsune.users.tests import UserFactory, add_permission
+from kitsune.users.tests import GroupFactory, UserFactory, add_permission
 from kitsune.wiki.badges import WIKI_BADGES
 from kitsune.wiki.config import TEMPLATE_TITLE_PREFIX, TEMPLATES_CATEGORY
 from kitsune.wiki.models import Document, Revision, RevisionAnchorRecord
@@ -25,10 +29,13 @@ from kitsune.wiki.tasks import (
     render_document_cascade,
     schedule_rebuild_kb,
     send_reviewed_notification,
+    send_weekly_ready_for_review_digest,
 )
 from kitsune.wiki.tests import (
     ApprovedRevisionFactory,
     DeferredRevisionFactory,
+    DocumentFactory,
+    LocaleFactory,
     RevisionAnchorRecordFactory,
     RevisionFactory,
 )
@@ -313,6 +320,138 @@ class TestMaybeAwardBadge(TestCase):
         self.assertTrue(badge.is_awarded_to(u))
 
 
+class ReadyForReviewDigestTestCase(TestCase):
+    """Test the weekly "Ready for review" digest."""
+
+    def setUp(self):
+        self.product = ProductFactory()
+        self.reviewer = UserFactory()
+        self.team = LocaleFactory(locale="en-US")
+        self.team.reviewers.add(self.reviewer)
+
+    def _pending_doc(self, **kwargs):
+        """Create a document with a revision waiting for review."""
+        doc = DocumentFactory(**kwargs)
+        RevisionFactory(document=doc)
+        return doc
+
+    def _run_digest(self):
+        """Run the digest without rendering or sending it, and return the make_mail mock."""
+        with (
+            mock.patch.object(email_utils, "make_mail") as make_mail,
+            mock.patch.object(email_utils, "send_messages"),
+        ):
+            send_weekly_ready_for_review_digest()
+        return make_mail
+
+    def _docs_lists(self):
+        """Run the digest, and return the ids of each recipient's documents by product."""
+        return {
+            call.kwargs["to_email"]: {
+                entry["product"]: {doc["id"] for doc in entry["docs"]}
+                for entry in call.kwargs["context_vars"]["docs_list"]
+            }
+            for call in self._run_digest().call_args_list
+        }
+
+    def test_document_listed_under_its_product(self):
+        doc = self._pending_doc(products=[self.product])
+
+        self.assertEqual(self._docs_lists(), {self.reviewer.email: {self.product.title: {doc.id}}})
+
+    def test_translation_listed_under_parent_products(self):
+        reviewer = UserFactory()
+        LocaleFactory(locale="de").reviewers.add(reviewer)
+        parent = DocumentFactory(products=[self.product])
+        translation = self._pending_doc(locale="de", parent=parent)
+
+        self.assertEqual(
+            self._docs_lists(), {reviewer.email: {self.product.title: {translation.id}}}
+        )
+
+    def test_document_without_products_listed_under_other_products(self):
+        doc = self._pending_doc()
+
+        self.assertEqual(self._docs_lists(), {self.reviewer.email: {"Other products": {doc.id}}})
+
+    def test_inactive_products_ignored(self):
+        archived = ProductFactory(is_archived=True)
+        doc = self._pending_doc(products=[self.product, archived])
+
+        self.assertEqual(self._docs_lists(), {self.reviewer.email: {self.product.title: {doc.id}}})
+
+    def test_restricted_documents_hidden_from_reviewer(self):
+        doc = self._pending_doc(products=[self.product])
+        self._pending_doc(products=[self.product], restrict_to_groups=[GroupFactory()])
+
+        self.assertEqual(self._docs_lists(), {self.reviewer.email: {self.product.title: {doc.id}}})
+
+    def test_staff_and_superusers_see_restricted_documents(self):
+        staff = UserFactory(groups=[GroupFactory(name=settings.STAFF_GROUP)])
+        superuser = UserFactory(is_superuser=True)
+        self.team.reviewers.add(staff, superuser)
+        doc = self._pending_doc(products=[self.product])
+        restricted_doc = self._pending_doc(
+            products=[self.product], restrict_to_groups=[GroupFactory()]
+        )
+
+        self.assertEqual(
+            self._docs_lists(),
+            {
+                staff.email: {self.product.title: {doc.id, restricted_doc.id}},
+                superuser.email: {self.product.title: {doc.id, restricted_doc.id}},
+                self.reviewer.email: {self.product.title: {doc.id}},
+            },
+        )
+
+    @mock.patch("kitsune.wiki.tasks.REVIEW_DIGEST_BATCH_SIZE", 2)
+    def test_digests_sent_in_batches(self):
+        reviewers = [self.reviewer, *UserFactory.create_batch(4)]
+        self.team.reviewers.add(*reviewers)
+        self._pending_doc(products=[self.product])
+
+        with mock.patch.object(
+            email_utils, "send_messages", wraps=email_utils.send_messages
+        ) as send_messages:
+            send_weekly_ready_for_review_digest()
+
+        self.assertEqual(send_messages.call_count, 3)
+        self.assertEqual(
+            sorted(to for message in mail.outbox for to in message.to),
+            sorted(user.email for user in reviewers),
+        )
+
+    def test_no_digest_when_every_document_is_restricted(self):
+        group = GroupFactory()
+        member = UserFactory(groups=[group])
+        self.team.reviewers.add(member)
+        self._pending_doc(products=[self.product], restrict_to_groups=[group])
+
+        send_weekly_ready_for_review_digest()
+
+        self.assertEqual([message.to for message in mail.outbox], [[member.email]])
+
+    def test_queries_per_reviewer(self):
+        self._pending_doc(products=[self.product])
+        # Warm up anything cached on the first run.
+        self._run_digest()
+
+        with CaptureQueriesContext(connection) as one_reviewer:
+            self._run_digest()
+
+        staff_group = GroupFactory(name=settings.STAFF_GROUP)
+        self.team.reviewers.add(
+            *UserFactory.create_batch(2),
+            *UserFactory.create_batch(2, groups=[staff_group]),
+            UserFactory(is_superuser=True),
+        )
+
+        # Each other reviewer costs only their own document list query, and
+        # the staff members and superuser share a single one.
+        with self.assertNumQueries(len(one_reviewer) + 3):
+            self.assertEqual(self._run_digest().call_count, 6)
+
+
 class CleanupOldAnchorRecordsTestCase(TestCase):
     """Test the cleanup_old_anchor_records task."""
 
@@ -1764,7 +1764,17 @@ def recent_revisions(request):
         if start or end:
             filters.update(created__range=(start or datetime.min, end or Now()))
 
-    revs = Revision.objects.visible(request.user, **filters).order_by("-created")
+    # The revision each one would be compared against, for its diff link.
+    previous = Revision.objects.filter(
+        document=OuterRef("document"), id__lt=OuterRef("id"), is_approved=True
+    ).order_by("-created")
+
+    revs = (
+        Revision.objects.visible(request.user, **filters)
+        .select_related("document", "creator__profile")
+        .annotate(previous_id=Subquery(previous.values("id")[:1]))
+        .order_by("-created")
+    )
 
     revs = paginate(request, revs)
 
@@ -10,6 +10,8 @@ class MyProfileEditSettingsPage(BasePage):
         self.edit_settings_page_header = page.locator("h3[class='sumo-page-heading']")
         self.edit_settings_checkbox_options_label = page.locator(
             "div[class='field checkbox'] label")
+        self.edit_settings_checkbox_inputs = page.locator(
+            "article#edit-settings form input[type='checkbox']")
         self.watch_forum_threads_I_start_checkbox = page.locator(
             "//input[@id='id_forums_watch_new_thread']/following-sibling::label")
         self.watch_forum_threads_I_comment_in_checkbox = page.locator(
@@ -96,11 +98,10 @@ class MyProfileEditSettingsPage(BasePage):
 
     def are_all_checkbox_checked(self) -> bool:
         """Check if all checkboxes are checked"""
-        return all([
-            self.is_watch_forum_threads_i_start_checkbox_checked(),
-            self.is_watch_forum_threads_i_comment_checkbox_checked(),
-            self.is_watch_kb_discussion_threads_i_start_checkbox_checked(),
-            self.is_watch_kb_discussion_threads_i_comment_checkbox_checked(),
-            self.is_watch_question_threads_i_comment_checkbox_checked(),
-            self.is_send_emails_for_private_messages_checkbox_checked(),
-        ])
+        return self.edit_settings_checkbox_inputs.evaluate_all(
+            "els => els.length > 0 && els.every(e => e.checked)")
+
+    def are_no_checkbox_checked(self) -> bool:
+        """Check if none of the checkboxes are checked"""
+        return self.edit_settings_checkbox_inputs.evaluate_all(
+            "els => els.length > 0 && els.every(e => !e.checked)")